@@ -1,4 +1,5 @@
 import abc
+import functools
 import random
 
 import constants
@@ -8,8 +9,14 @@ from cell_calculators import (
     MaxShadeCellCalculator,
     RandomOffsetMaxShadeCellCalculator,
 )
-from cursor_initializers import CursorInitializer, OriginCursorInitializer, RandomCursorInitializer
-from move_proposers import MoveProposer, RandomMoveProposer, SystematicMoveProposer
+from cursor_initializers import (
+    CursorInitializer,
+    OriginCursorInitializer,
+    RandomCursorInitializer,
+    learned_cursor_initializer_class,
+)
+from move_proposers import MoveProposer, RandomMoveProposer, SystematicMoveProposer, learned_move_proposer_class
+from policies import LinearValuePolicy
 
 # The move proposer is the new class type of what we were previously calling algorithms
 
@@ -19,14 +26,24 @@ class GameParamaters(object):
 
     # TODO This should be a dataclass
 
-    def __init__(self, game_dimensions: list[int], shade_size):
+    def __init__(self, game_dimensions: list[int], shade_size, turns_per_game=constants.TURNS_PER_GAME):
         self.game_dimensions = game_dimensions
         self.shade_size = shade_size
+        self.turns_per_game = turns_per_game
+
+    @property
+    def runtime_kwargs(self) -> dict:
+        """The keyword arguments that make a Runtime play a game with these parameters."""
+        return {
+            "game_size": list(self.game_dimensions),
+            "shade_size": self.shade_size,
+            "turns_per_game": self.turns_per_game,
+        }
 
 
 class DefaultGameParameters(GameParamaters):
     def __init__(self):
-        super().__init__(constants.GAME_SIZE, constants.SHADE_SIZE)
+        super().__init__(constants.GAME_SIZE, constants.SHADE_SIZE, constants.TURNS_PER_GAME)
 
 
 class AlgorithmParamaters(object):
@@ -52,8 +69,9 @@ class AlgorithmParamaters(object):
 
 class AbstractAlgorithm(abc.ABC):
     def __init__(self, game_params, alg_params, seed=None):
-        # Pass a seed to the RNG if it is provided
-        random.seed(a=seed)
+        # Each algorithm draws from its own generator, so two algorithms in the same game can't disturb each other's
+        # random numbers
+        self.random = random.Random(seed)
 
         self._game_params = game_params
         self._alg_params = alg_params
@@ -86,6 +104,11 @@ class AbstractAlgorithm(abc.ABC):
         pass
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_claimable_cells(cell_calculator_class, game_dimensions, shade_size):
+    return cell_calculator_class(GameParamaters(list(game_dimensions), shade_size)).get_claimable_cells()
+
+
 class ConstructedAlgorithm(AbstractAlgorithm):
     """The canonical way to build up an algorithm.
 
@@ -94,17 +117,31 @@ class ConstructedAlgorithm(AbstractAlgorithm):
 
     def __init__(self, game_params, alg_params, seed=None):
         super().__init__(game_params, alg_params, seed=seed)
-        cursor_initializer = self.cursor_initializer_class(self.claimable_cells)
+        self._claimable_cells = self._calculate_claimable_cells()
+        cursor_initializer = self.cursor_initializer_class(self.claimable_cells, rng=self.random)
         self.claimable_cells_cursor = cursor_initializer.get_cursor_initial_index()
 
+    def _calculate_claimable_cells(self):
+        """Claimable cells only need to be worked out once per algorithm.
+
+        If the cell calculator is deterministic, the cells are also shared with every other algorithm using the same
+        calculator and game parameters.
+        """
+        if self.cell_calculator_class.is_deterministic:
+            return _shared_claimable_cells(self.cell_calculator_class, tuple(self.game_dimensions), self.shade_size)
+
+        cell_calculator = self.cell_calculator_class(self._game_params, rng=self.random)
+        return cell_calculator.get_claimable_cells()
+
     @property
     def claimable_cells(self):
-        cell_calculator = self.cell_calculator_class(self._game_params)
-        return cell_calculator.get_claimable_cells()
+        return self._claimable_cells
 
     @property
     def move_proposer(self):
-        return self.move_proposer_class(self._game_params, self.claimable_cells, self.claimable_cells_cursor)
+        return self.move_proposer_class(
+            self._game_params, self.claimable_cells, self.claimable_cells_cursor, rng=self.random
+        )
 
     def propose_move(self):
         """Propose the next move to attempt.
@@ -137,17 +174,19 @@ def algorithm_factory(
     return ConstructedAlgorithm(game_params, alg_params, seed)
 
 
-def random_algorithm_factory(seed=None) -> ConstructedAlgorithm:
+def random_algorithm_factory(seed=None, game_params: GameParamaters = DefaultGameParameters()) -> ConstructedAlgorithm:
     """Makes a completely random move given the game dimensions.
 
     Mostly just useful for a POC, but could also be used as a baseline to benchmark other algorithms.
     """
     alg_params = AlgorithmParamaters(AllCellCalculator, OriginCursorInitializer, RandomMoveProposer)
 
-    return algorithm_factory(alg_params, seed=seed)
+    return algorithm_factory(alg_params, game_params=game_params, seed=seed)
 
 
-def systematic_max_shade_factory(seed=None) -> ConstructedAlgorithm:
+def systematic_max_shade_factory(
+    seed=None, game_params: GameParamaters = DefaultGameParameters()
+) -> ConstructedAlgorithm:
     """Claimable spaces are columns 0 and 4. Starts at the origin and and goes through available spaces in order.
 
     This algorithm works in order but only makes moves in columns that have no chance of casting shade on a
@@ -155,23 +194,53 @@ def systematic_max_shade_factory(seed=None) -> ConstructedAlgorithm:
     """
     alg_params = AlgorithmParamaters(MaxShadeCellCalculator, OriginCursorInitializer, SystematicMoveProposer)
 
-    return algorithm_factory(alg_params, seed=seed)
+    return algorithm_factory(alg_params, game_params=game_params, seed=seed)
 
 
-def random_start_systematic_max_shade_factory(seed=None) -> ConstructedAlgorithm:
+def random_start_systematic_max_shade_factory(
+    seed=None, game_params: GameParamaters = DefaultGameParameters()
+) -> ConstructedAlgorithm:
     """Claimable spaces are columns 0 and 4. Starts at a random cell and and goes through available spaces in order."""
 
     alg_params = AlgorithmParamaters(MaxShadeCellCalculator, RandomCursorInitializer, SystematicMoveProposer)
 
-    return algorithm_factory(alg_params, seed=seed)
+    return algorithm_factory(alg_params, game_params=game_params, seed=seed)
 
 
-def random_start_random_offset_max_shade_factory(seed=None) -> ConstructedAlgorithm:
+def random_start_random_offset_max_shade_factory(
+    seed=None, game_params: GameParamaters = DefaultGameParameters()
+) -> ConstructedAlgorithm:
     """Claimable spaces are 2 random columns spaced MAX_SHADE apart. Starts at a random cell and and goes through available spaces in order."""
 
     alg_params = AlgorithmParamaters(RandomOffsetMaxShadeCellCalculator, RandomCursorInitializer, RandomMoveProposer)
 
-    return algorithm_factory(alg_params, seed=seed)
+    return algorithm_factory(alg_params, game_params=game_params, seed=seed)
+
+
+def learned_algorithm_factory(policy, seed=None, game_params: GameParamaters = None) -> ConstructedAlgorithm:
+    """Works through all cells from most to least valuable according to a learned policy.
+
+    `policy` is either a LinearValuePolicy or the path to a checkpoint saved by the self-play trainer.  If no game
+    parameters are given, the ones the policy was trained with are used.  Given game parameters must match the policy's
+    board and shade size.
+    """
+    if not isinstance(policy, LinearValuePolicy):
+        policy = LinearValuePolicy.load(policy)
+
+    if game_params is None:
+        game_params = GameParamaters(policy.game_dimensions, policy.shade_size)
+    elif list(game_params.game_dimensions) != policy.game_dimensions or game_params.shade_size != policy.shade_size:
+        raise ValueError(
+            f"{policy} was trained for a {policy.game_dimensions} board with shade size {policy.shade_size}, not "
+            f"{list(game_params.game_dimensions)} with shade size {game_params.shade_size}"
+        )
+
+    # The policy is bound to subclasses, because algorithms are built from classes
+    alg_params = AlgorithmParamaters(
+        AllCellCalculator, learned_cursor_initializer_class(policy), learned_move_proposer_class(policy)
+    )
+
+    return algorithm_factory(alg_params, game_params=game_params, seed=seed)
 
 
 """
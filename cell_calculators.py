@@ -6,9 +6,14 @@ import random
 class CellCalculator(abc.ABC):
     """Determines which cells on the board can be claimed by our algorithm. """
 
-    def __init__(self, game_params):
+    # Deterministic calculators always return the same cells for the same game parameters, so their results can be
+    # shared between algorithms
+    is_deterministic = True
+
+    def __init__(self, game_params, rng=None):
         self.w, self.h = game_params.game_dimensions
         self.shade_size = game_params.shade_size
+        self._random = rng if rng is not None else random
 
     @abc.abstractmethod
     def get_claimable_cells(self) -> list[tuple[int, int]]:
@@ -31,8 +36,8 @@ class AllCellCalculator(CellCalculator):
 class MaxShadeCellCalculator(CellCalculator):
     """Claim all possible cells that we can guarantee will not case shade on each other."""
 
-    def __init__(self, game_params, offset_seed=0):
-        super().__init__(game_params)
+    def __init__(self, game_params, offset_seed=0, rng=None):
+        super().__init__(game_params, rng=rng)
         # This way we can give an arbitrarily large random number and make sure we're still getting the max shade
         self.offset = offset_seed % self.shade_size
 
@@ -50,6 +55,8 @@ class MaxShadeCellCalculator(CellCalculator):
 class RandomOffsetMaxShadeCellCalculator(MaxShadeCellCalculator):
     """Instead of starting the MaxShadeCalculator at column 0, start it at a random column between 0 and SHADE_SIZE."""
 
-    def __init__(self, game_params):
-        offset_seed = random.randint(1, 1000)
-        super().__init__(game_params, offset_seed=offset_seed)
+    is_deterministic = False
+
+    def __init__(self, game_params, rng=None):
+        rng = rng if rng is not None else random
+        super().__init__(game_params, offset_seed=rng.randint(1, 1000), rng=rng)
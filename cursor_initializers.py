@@ -5,8 +5,9 @@ import random
 class CursorInitializer(abc.ABC):
     """Determines the starting index of an algorithm's cursor."""
 
-    def __init__(self, claimable_cells):
+    def __init__(self, claimable_cells, rng=None):
         self.claimable_cells = claimable_cells
+        self._random = rng if rng is not None else random
 
     @abc.abstractmethod
     def get_cursor_initial_index(self) -> int:
@@ -25,4 +26,17 @@ class RandomCursorInitializer(CursorInitializer):
     """Initializes our cursor at a random cell."""
 
     def get_cursor_initial_index(self) -> int:
-        return random.randrange(0, len(self.claimable_cells))
+        return self._random.randrange(0, len(self.claimable_cells))
+
+
+class LearnedCursorInitializer(CursorInitializer):
+    """Initializes our cursor at the cell a learned policy values most."""
+
+    policy = None
+
+    def get_cursor_initial_index(self) -> int:
+        return self.policy.ranking(self.claimable_cells)[0]
+
+
+def learned_cursor_initializer_class(policy) -> type:
+    return type("BoundLearnedCursorInitializer", (LearnedCursorInitializer,), {"policy": policy})
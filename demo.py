@@ -1,4 +1,5 @@
-from collections import Counter
+import sys
+import tempfile
 from dataclasses import dataclass
 
 from algorithms import (
@@ -7,28 +8,22 @@ from algorithms import (
     random_start_random_offset_max_shade_factory,
 )
 from game import FreeForAllGame
-from runtime import Runtime
+from results_store import ResultsStore
+from runtime import simulate_paired_games
 
 NUMBER_OF_ROUNDS = 100
 
 
-def setup_game(switch_order=False):
-    algorithm_0 = random_start_systematic_max_shade_factory()
-    algorithm_1 = systematic_max_shade_factory()
-    rt = Runtime(FreeForAllGame, algorithm_0, algorithm_1, print_moves=True)
-    return rt
-
-
 @dataclass
 class GameLog:
-    """A log of the results of a single game."""
+    """A log of the results of a single game, scores are by algorithm rather than by seat."""
 
     game_number: int
     player_0_score: int
     player_1_score: int
 
     def __str__(self):
-        return f"Player 0 Score: {player_0_score}\nPlayer 1 Score: {player_1_score}\nWinner: {self.winner}"
+        return f"Player 0 Score: {self.player_0_score}\nPlayer 1 Score: {self.player_1_score}\nWinner: {self.winner}"
 
     @property
     def winner(self):
@@ -41,30 +36,52 @@ class GameLog:
             return 1
 
 
-game_log_collection = []
-for game in range(NUMBER_OF_ROUNDS):
-    print(f"Game {game}\n")
-    # The order that players go confers a clear advantage, let's switch these each time to eliminate that noise
-    should_switch_order = game % 2 == 1
-    rt = setup_game(switch_order=should_switch_order)
-    player_0_score, player_1_score = rt.simulate_game()
-
-    log = GameLog(game, player_0_score, player_1_score)
-    game_log_collection.append(log)
-
-    print(log)
-
-    print("=======================\n")
-player_0_score_counts = Counter([log.player_0_score for log in game_log_collection])
-player_0_score_counts = sorted(player_0_score_counts.items())
-player_0_score_counts = ", ".join(f"{score}:{count}" for score, count in player_0_score_counts)
-
-player_1_score_counts = Counter([log.player_1_score for log in game_log_collection])
-player_1_score_counts = sorted(player_1_score_counts.items())
-player_1_score_counts = ", ".join(f"{score}:{count}" for score, count in player_1_score_counts)
-
-win_counts = Counter([log.winner for log in game_log_collection]).items()
-win_counts = ", ".join(f"{winner}: {count}" for winner, count in win_counts)
-print(f"Player 0 (score: count) -- {player_0_score_counts}")
-print(f"Player 1 (score: count) -- {player_1_score_counts}")
-print(f"Win counts (winner: count) -- {win_counts}")
+# Results are kept in a columnar store rather than a list of GameLogs so the same summaries work for huge runs.  Pass a
+# directory to keep them, otherwise they go in a temporary directory that is removed once the summary is printed.
+results_directory = sys.argv[1] if len(sys.argv) > 1 else None
+temporary_directory = tempfile.TemporaryDirectory(prefix="shade_game_results_")
+with temporary_directory, ResultsStore(results_directory or temporary_directory.name) as results_store:
+    paired_differentials = []
+    # The order that players go confers a clear advantage, so every seed is played from both seats to remove that noise
+    for pair in range(NUMBER_OF_ROUNDS // 2):
+        paired_result = simulate_paired_games(
+            FreeForAllGame,
+            random_start_systematic_max_shade_factory,
+            systematic_max_shade_factory,
+            seed=pair,
+            print_moves=True,
+        )
+        paired_differentials.append(paired_result.differential)
+
+        seatings = [
+            (False, paired_result.scores, paired_result.score_history),
+            (True, paired_result.swapped_scores, paired_result.swapped_score_history),
+        ]
+        for switched_order, scores, score_history in seatings:
+            game = len(results_store)
+            print(f"Game {game}\n")
+
+            log = GameLog(game, *scores)
+            results_store.append(game, (0, 1), int(switched_order), scores, score_history)
+
+            print(log)
+
+            print("=======================\n")
+        print(f"Pair {pair} differential (player 0 - player 1): {paired_result.differential}\n")
+
+    player_0_score_counts = sorted(results_store.score_counts(0).items())
+    player_0_score_counts = ", ".join(f"{score}:{count}" for score, count in player_0_score_counts)
+
+    player_1_score_counts = sorted(results_store.score_counts(1).items())
+    player_1_score_counts = ", ".join(f"{score}:{count}" for score, count in player_1_score_counts)
+
+    win_counts = results_store.win_counts().items()
+    win_counts = ", ".join(f"{winner}: {count}" for winner, count in win_counts)
+    print(f"Player 0 (score: count) -- {player_0_score_counts}")
+    print(f"Player 1 (score: count) -- {player_1_score_counts}")
+    print(f"Win counts (winner: count) -- {win_counts}")
+    mean_differential = sum(paired_differentials) / len(paired_differentials)
+    print(f"Mean paired differential (player 0 - player 1) -- {mean_differential}")
+
+if results_directory:
+    print(f"Full results stored in {results_directory}")
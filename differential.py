@@ -0,0 +1,193 @@
+import abc
+import random
+from dataclasses import dataclass, replace
+
+from fast_game import BatchedFreeForAllGames
+from game import UNCLAIMED, FreeForAllGame
+
+MAX_BOARD_SIZE = 10
+MAX_MOVES = 80
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Everything about a game's state that two engines must agree on after a move."""
+
+    shade_map: tuple
+    ownership: tuple
+    cumulative_scores: tuple
+
+
+@dataclass(frozen=True)
+class Case:
+    """A board and a sequence of ((x, y), player) moves to play on it."""
+
+    w: int
+    h: int
+    sun_angle: int
+    moves: tuple
+
+    def __str__(self):
+        return f"Case(w={self.w}, h={self.h}, sun_angle={self.sun_angle}, moves={list(self.moves)})"
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """The first move after which an engine disagreed with the reference."""
+
+    case: Case
+    move_number: int
+    expected: Snapshot
+    actual: Snapshot
+
+    def __str__(self):
+        differences = [
+            f"  {field}: expected {getattr(self.expected, field)}, got {getattr(self.actual, field)}"
+            for field in ("shade_map", "ownership", "cumulative_scores")
+            if getattr(self.expected, field) != getattr(self.actual, field)
+        ]
+        return "\n".join([f"{self.case}", f"Engines disagree after move {self.move_number}:"] + differences)
+
+
+class EngineAdapter(abc.ABC):
+    """Gives the differential harness a common way to drive and inspect a game engine."""
+
+    def __init__(self, w, h, sun_angle):
+        self.w = w
+        self.h = h
+        self.sun_angle = sun_angle
+
+    @abc.abstractmethod
+    def attempt_move(self, coordinates, player):
+        pass
+
+    @abc.abstractmethod
+    def snapshot(self) -> Snapshot:
+        """Shade and ownership are flattened in `x * h + y` order."""
+        pass
+
+
+class ReferenceEngine(EngineAdapter):
+    """The game as implemented by AbstractGame, which every other engine is checked against."""
+
+    game_class = FreeForAllGame
+
+    def __init__(self, w, h, sun_angle):
+        super().__init__(w, h, sun_angle)
+        self.game = self.game_class(w, h, sun_angle=sun_angle)
+
+    def attempt_move(self, coordinates, player):
+        self.game.attempt_move(coordinates, player)
+
+    def snapshot(self):
+        cells = [cell for column in self.game.game_board for cell in column]
+        return Snapshot(
+            tuple(int(cell.is_shaded) for cell in cells),
+            tuple(cell.claimed_by for cell in cells),
+            (self.game.player_0_score, self.game.player_1_score),
+        )
+
+
+class BatchedEngine(EngineAdapter):
+    """Plays the last game of a BatchedFreeForAllGames, so offsets into the shared arrays are exercised too."""
+
+    number_of_games = 3
+
+    def __init__(self, w, h, sun_angle):
+        super().__init__(w, h, sun_angle)
+        self.games = BatchedFreeForAllGames(self.number_of_games, w, h, sun_angle)
+        self.game = self.number_of_games - 1
+
+    def attempt_move(self, coordinates, player):
+        self.games.attempt_move(self.game, self.games.cell_index(coordinates), player)
+
+    def snapshot(self):
+        cells = slice(self.game * self.games.cells_per_game, (self.game + 1) * self.games.cells_per_game)
+        return Snapshot(
+            tuple(self.games.shaded[cells]),
+            tuple(None if owner == UNCLAIMED else owner for owner in self.games.owner[cells]),
+            self.games.cumulative_score(self.game),
+        )
+
+
+def generate_case(rng: random.Random, max_board_size=MAX_BOARD_SIZE, max_moves=MAX_MOVES) -> Case:
+    w = rng.randint(1, max_board_size)
+    h = rng.randint(1, max_board_size)
+    moves = tuple(((rng.randrange(w), rng.randrange(h)), rng.randrange(2)) for _ in range(rng.randint(0, max_moves)))
+    return Case(w, h, rng.randint(1, 3), moves)
+
+
+def run_case(case, engine_class, reference_class=ReferenceEngine) -> Mismatch:
+    """Play `case` on both engines, comparing them after every move.  Returns None if they always agree."""
+    reference = reference_class(case.w, case.h, case.sun_angle)
+    engine = engine_class(case.w, case.h, case.sun_angle)
+
+    for move_number, (coordinates, player) in enumerate(case.moves, start=1):
+        reference.attempt_move(coordinates, player)
+        engine.attempt_move(coordinates, player)
+
+        expected = reference.snapshot()
+        actual = engine.snapshot()
+        if expected != actual:
+            return Mismatch(case, move_number, expected, actual)
+
+    return None
+
+
+def _smaller_cases(case):
+    """Candidate simplifications of `case`, roughly from most to least aggressive."""
+    moves = case.moves
+
+    # Drop chunks of moves, halving the chunk size each time down to single moves
+    chunk_size = len(moves) // 2
+    while chunk_size >= 1:
+        for start in range(0, len(moves), chunk_size):
+            yield replace(case, moves=moves[:start] + moves[start + chunk_size :])
+        chunk_size //= 2
+
+    # Shrink the board, dropping any moves that no longer fit on it
+    for w, h in ((case.w - 1, case.h), (case.w, case.h - 1)):
+        if w >= 1 and h >= 1:
+            yield replace(case, w=w, h=h, moves=tuple(move for move in moves if move[0][0] < w and move[0][1] < h))
+
+    if case.sun_angle > 1:
+        yield replace(case, sun_angle=case.sun_angle - 1)
+
+    # Simplify individual moves towards player 0 at the origin
+    for i, ((x, y), player) in enumerate(moves):
+        for simpler_move in (((x, y), 0), ((x - 1, y), player), ((x, y - 1), player)):
+            simpler_x, simpler_y = simpler_move[0]
+            if simpler_x >= 0 and simpler_y >= 0 and simpler_move != moves[i]:
+                yield replace(case, moves=moves[:i] + (simpler_move,) + moves[i + 1 :])
+
+
+def shrink(mismatch, engine_class, reference_class=ReferenceEngine) -> Mismatch:
+    """Greedily simplify a failing case until no simpler case still fails."""
+    # Nothing after the first disagreement can matter
+    case = replace(mismatch.case, moves=mismatch.case.moves[: mismatch.move_number])
+    mismatch = run_case(case, engine_class, reference_class)
+
+    made_progress = True
+    while made_progress:
+        made_progress = False
+        for smaller_case in _smaller_cases(mismatch.case):
+            smaller_mismatch = run_case(smaller_case, engine_class, reference_class)
+            if smaller_mismatch is not None:
+                mismatch = smaller_mismatch
+                made_progress = True
+                break
+
+    return mismatch
+
+
+def check_engine(engine_class, number_of_cases=200, seed=0, reference_class=ReferenceEngine):
+    """Run `number_of_cases` random cases, raising an AssertionError with a minimal failing case if any disagree."""
+    rng = random.Random(seed)
+
+    for _ in range(number_of_cases):
+        mismatch = run_case(generate_case(rng), engine_class, reference_class)
+        if mismatch is not None:
+            minimal_mismatch = shrink(mismatch, engine_class, reference_class)
+            raise AssertionError(
+                f"{engine_class.__name__} diverged from {reference_class.__name__}:\n{minimal_mismatch}"
+            )
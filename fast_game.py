@@ -0,0 +1,91 @@
+from array import array
+
+from constants import SHADE_SIZE
+from game import SUN_ANGLES, UNCLAIMED, shade_table
+
+
+class BatchedFreeForAllGames(object):
+    """Many FreeForAllGames stepped side by side without any per-cell Python objects.
+
+    The state of every game lives in flat arrays indexed by `game * cells_per_game + cell`, where a cell index is
+    `x * h + y` to match `game_board[x][y]`.  Moves follow the same rules as `AbstractGame.attempt_move`, including
+    shade sticking around once cast and the cumulative score being topped up after every move, but scores are kept
+    up to date incrementally instead of rescanning the board.
+    """
+
+    def __init__(self, number_of_games, w, h, sun_angle=SHADE_SIZE):
+        if sun_angle not in SUN_ANGLES:
+            raise ValueError("Sun angle must be betewen 1-3")
+
+        self.number_of_games = number_of_games
+        self.w = w
+        self.h = h
+        self.sun_angle = sun_angle
+        self.cells_per_game = w * h
+
+        # The cell indexes shaded by an angled cell, relative to the start of its game
+        self._shaded_cells = [
+            tuple(shaded_column * h + y for shaded_column in shade_table(w, sun_angle)[x])
+            for x in range(w)
+            for y in range(h)
+        ]
+
+        size = number_of_games * self.cells_per_game
+        self.angled = bytearray(size)
+        self.shaded = bytearray(size)
+        self.owner = bytearray([UNCLAIMED]) * size
+        # Unshaded cells owned by each player right now, interleaved as [game 0 player 0, game 0 player 1, ...]
+        self.current_scores = array("l", bytes(array("l").itemsize * 2 * number_of_games))
+        # Running totals of current_scores after every move, the same as AbstractGame.player_n_score
+        self.cumulative_scores = array("l", self.current_scores)
+
+    def reset(self):
+        """Start every game over, reusing the existing buffers."""
+        size = self.number_of_games * self.cells_per_game
+        self.angled[:] = bytes(size)
+        self.shaded[:] = bytes(size)
+        self.owner[:] = bytes([UNCLAIMED]) * size
+        self.current_scores[:] = array("l", bytes(len(self.current_scores) * self.current_scores.itemsize))
+        self.cumulative_scores[:] = self.current_scores
+
+    def cell_index(self, coordinates):
+        x, y = coordinates
+        return x * self.h + y
+
+    def attempt_move(self, game, cell, player):
+        """Toggle `cell` (an index from `cell_index`) for `player` in `game` and update its scores."""
+        offset = game * self.cells_per_game
+        index = offset + cell
+        scores = self.current_scores
+        angled = self.angled
+        shaded = self.shaded
+        owner = self.owner
+
+        is_angled = angled[index] ^ 1
+        angled[index] = is_angled
+
+        previous_owner = owner[index]
+        owner[index] = player
+        if not shaded[index]:
+            if previous_owner != UNCLAIMED:
+                scores[2 * game + previous_owner] -= 1
+            scores[2 * game + player] += 1
+
+        if is_angled:
+            for shaded_cell in self._shaded_cells[cell]:
+                shaded_index = offset + shaded_cell
+                if not shaded[shaded_index]:
+                    shaded[shaded_index] = 1
+                    shaded_owner = owner[shaded_index]
+                    if shaded_owner != UNCLAIMED:
+                        scores[2 * game + shaded_owner] -= 1
+
+        self.cumulative_scores[2 * game] += scores[2 * game]
+        self.cumulative_scores[2 * game + 1] += scores[2 * game + 1]
+
+    def score(self, game) -> tuple:
+        """Both players' scores based on the current board, the same as `AbstractGame.calculate_score`."""
+        return self.current_scores[2 * game], self.current_scores[2 * game + 1]
+
+    def cumulative_score(self, game) -> tuple:
+        return self.cumulative_scores[2 * game], self.cumulative_scores[2 * game + 1]
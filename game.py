@@ -1,6 +1,11 @@
 import abc
+import functools
+
 from constants import SHADE_SIZE
 
+# The sun can shade between 1 and 3 cells to the right of an angled cell
+SUN_ANGLES = range(1, 4)
+
 # Set up ownership and claimability next
 # How will we identify players? Do they need their own object, or just a string?
 # We should probably set claimable when initializing...
@@ -15,15 +20,76 @@ class PermissionError(Exception):
         return f"PermissionError: Player {self.player} attempted to illegally toggle cell at {self.coordinates}"
 
 
+# Stored in CellStore.owner for cells nobody has claimed yet
+UNCLAIMED = 255
+
+
+class CellStore(object):
+    """The state of every cell on a board, kept as one flat array per attribute.
+
+    Cell `(x, y)` lives at index `x * h + y` of each array.  Owners are stored as small integers, with UNCLAIMED
+    standing in for None.
+    """
+
+    __slots__ = ("w", "h", "angled", "shaded", "claimable", "owner")
+
+    def __init__(self, w, h):
+        size = w * h
+        self.w = w
+        self.h = h
+        self.angled = bytearray(size)
+        self.shaded = bytearray(size)
+        self.claimable = bytearray([True]) * size
+        self.owner = bytearray([UNCLAIMED]) * size
+
+
 class Cell(object):
-    """Represents a single solar cell on our game board."""
+    """Represents a single solar cell on our game board.
+
+    A Cell is only a view onto its row in a CellStore, so boards can hand them out on demand instead of keeping an
+    object alive for every cell.
+    """
+
+    __slots__ = ("coordinates", "_store", "_index")
 
-    def __init__(self, coordinates):
-        self.is_angled = False
-        self.is_shaded = False
+    def __init__(self, coordinates, store=None, index=0):
         self.coordinates = coordinates
-        self.claimable = True
-        self.claimed_by = None
+        # A cell created on its own gets a store of its own
+        self._store = store if store is not None else CellStore(1, 1)
+        self._index = index
+
+    @property
+    def is_angled(self):
+        return bool(self._store.angled[self._index])
+
+    @is_angled.setter
+    def is_angled(self, val):
+        self._store.angled[self._index] = bool(val)
+
+    @property
+    def is_shaded(self):
+        return bool(self._store.shaded[self._index])
+
+    @is_shaded.setter
+    def is_shaded(self, val):
+        self._store.shaded[self._index] = bool(val)
+
+    @property
+    def claimable(self):
+        return bool(self._store.claimable[self._index])
+
+    @claimable.setter
+    def claimable(self, val):
+        self._store.claimable[self._index] = bool(val)
+
+    @property
+    def claimed_by(self):
+        owner = self._store.owner[self._index]
+        return None if owner == UNCLAIMED else owner
+
+    @claimed_by.setter
+    def claimed_by(self, player):
+        self._store.owner[self._index] = UNCLAIMED if player is None else player
 
     def __repr__(self):
         return "<Cell({})>".format(self.coordinates)
@@ -48,16 +114,82 @@ class Cell(object):
         return f"[{angle_representation} | {shade_representation} | {claimed_by_representation}]"
 
 
+@functools.lru_cache(maxsize=None)
+def shade_table(number_of_columns, sun_angle):
+    """For each column, the columns that an angled cell in it will shade.
+
+    This only depends on the board width and the sun angle, so it is computed once and shared by every game with the
+    same dimensions.
+    """
+    return tuple(
+        tuple(range(column + 1, min(column + sun_angle, number_of_columns - 1) + 1))
+        for column in range(number_of_columns)
+    )
+
+
+class BoardColumn(object):
+    """A single column of a GameBoard, indexed by row."""
+
+    __slots__ = ("_store", "_column_number")
+
+    def __init__(self, store, column_number):
+        self._store = store
+        self._column_number = column_number
+
+    def __len__(self):
+        return self._store.h
+
+    def __getitem__(self, row_number):
+        if row_number < 0:
+            row_number += self._store.h
+        if not 0 <= row_number < self._store.h:
+            raise IndexError("row index out of range")
+
+        return Cell((self._column_number, row_number), self._store, self._column_number * self._store.h + row_number)
+
+    def __iter__(self):
+        for row_number in range(self._store.h):
+            yield self[row_number]
+
+
+class GameBoard(object):
+    """The cells of a board, indexed as `game_board[x][y]` like a list of columns.
+
+    Columns and cells are created as they are accessed, all of the state lives in a single CellStore.
+    """
+
+    __slots__ = ("store",)
+
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return self.store.w
+
+    def __getitem__(self, column_number):
+        if column_number < 0:
+            column_number += self.store.w
+        if not 0 <= column_number < self.store.w:
+            raise IndexError("column index out of range")
+
+        return BoardColumn(self.store, column_number)
+
+    def __iter__(self):
+        for column_number in range(self.store.w):
+            yield self[column_number]
+
+
 class AbstractGame(abc.ABC):
     """Represents game state and the physical game board."""
 
-    def __init__(self, w, h):
+    def __init__(self, w, h, sun_angle=SHADE_SIZE):
         self.w = w
         self.h = h
+        self.cells = CellStore(w, h)
         self.game_board = self.create_game_board()
         self.player_0_score = 0
         self.player_1_score = 0
-        self._sun_angle = SHADE_SIZE
+        self.sun_angle = sun_angle
 
     def __repr__(self):
         return "<Game({}, {})>".format(self.w, self.h)
@@ -76,23 +208,16 @@ class AbstractGame(abc.ABC):
 
     @sun_angle.setter
     def sun_angle(self, val):
-        if val in range(1, 4):
-            self._angle = val
+        if val in SUN_ANGLES:
+            self._sun_angle = val
         else:
             raise ValueError("Sun angle must be betewen 1-3")
 
     def create_column(self, column_number):
-        column = []
-        for row_number in range(self.w):
-            column.append(Cell((column_number, row_number)))
-
-        return column
+        return BoardColumn(self.cells, column_number)
 
     def create_game_board(self):
-        game_board = []
-        for column_number in range(self.h):
-            game_board.append(self.create_column(column_number))
-        return game_board
+        return GameBoard(self.cells)
 
     def _clear_all_shaddows(self):
         """Sets `is_shaded` property of all cells on the game board to False
@@ -100,9 +225,7 @@ class AbstractGame(abc.ABC):
         This is a helper function that allows us to start each application of
         shade from a clean state.
         """
-        for column in self.game_board:
-            for cell in column:
-                cell.is_shaded = False
+        self.cells.shaded[:] = bytes(len(self.cells.shaded))
 
     def _cast_shaddow(self, cell_location):
         """Takes a tuple representing the X/Y coordinates of a cell and
@@ -112,14 +235,11 @@ class AbstractGame(abc.ABC):
         # TODO figure out why we aren't shading all the cells we should be.
         x, y = cell_location
         cells_affected = []
-        for i in range(1, self.sun_angle + 1):
-            try:
-                current_cell = self.game_board[x + i][y]
-                current_cell.is_shaded = True
-                cells_affected.append(current_cell)
-            except IndexError:
-                # The current shaddow is being cast at least partially off of the board
-                pass
+        # Any part of the shaddow that would be cast off of the board is already left out of the table
+        for shaded_column in shade_table(len(self.game_board), self.sun_angle)[x]:
+            current_cell = self.game_board[shaded_column][y]
+            current_cell.is_shaded = True
+            cells_affected.append(current_cell)
 
         return cells_affected
 
@@ -137,14 +257,18 @@ class AbstractGame(abc.ABC):
     def apply_shade(self):
         """Calculate shade for all cells in the game board."""
 
-        # Lets go over each cell, left-to-right, top-to-bottom
-        for i, column in enumerate(self.game_board):
-            for j, row in enumerate(column):
-                cell = self.game_board[i][j]
+        # This is _cast_shaddow for every angled cell, working on the cell store directly so that no Cell views need
+        # to be created
+        shaded_columns_by_column = shade_table(self.w, self.sun_angle)
+        shaded = self.cells.shaded
 
-                if cell.is_angled:
-                    # We've found a cell that is casting a shade
-                    self._cast_shaddow((i, j))
+        # Lets go over each cell, left-to-right, top-to-bottom
+        for index, is_angled in enumerate(self.cells.angled):
+            if is_angled:
+                # We've found a cell that is casting a shade
+                x, y = divmod(index, self.h)
+                for shaded_column in shaded_columns_by_column[x]:
+                    shaded[shaded_column * self.h + y] = True
 
     def attempt_move(self, coordinates, player):
         # There are some serious inconsitencies that need to be ironed out with the coordinate system not being
@@ -167,14 +291,11 @@ class AbstractGame(abc.ABC):
         """Return a tuple of both players' scores based on the current game board."""
         player_0_score = 0
         player_1_score = 0
-        for row in range(self.h):
-            for column in self.game_board:
-                cell = column[row]
-
-                if cell.claimed_by == 0 and not cell.is_shaded:
-                    player_0_score += 1
-                elif cell.claimed_by == 1 and not cell.is_shaded:
-                    player_1_score += 1
+        for claimed_by, is_shaded in zip(self.cells.owner, self.cells.shaded):
+            if claimed_by == 0 and not is_shaded:
+                player_0_score += 1
+            elif claimed_by == 1 and not is_shaded:
+                player_1_score += 1
 
         return (player_0_score, player_1_score)
 
@@ -9,8 +9,9 @@ class MoveProposer(abc.ABC):
     cursor based on its internal logic.
     """
 
-    def __init__(self, game_params, claimable_cells: list, cursor_index: int):
+    def __init__(self, game_params, claimable_cells: list, cursor_index: int, rng=None):
         self._game_params = game_params
+        self._random = rng if rng is not None else random
         self._claimable_cells = claimable_cells
         self._count_of_claimable_cells = len(self._claimable_cells)
         self._cursor_index = cursor_index
@@ -27,7 +28,7 @@ class RandomMoveProposer(MoveProposer):
     """
 
     def propose_move(self) -> int:
-        return random.choice(range(self._count_of_claimable_cells))
+        return self._random.choice(range(self._count_of_claimable_cells))
 
 
 class SystematicMoveProposer(MoveProposer):
@@ -43,3 +44,16 @@ class SystematicMoveProposer(MoveProposer):
             self._cursor_index = 0
 
         return self._cursor_index
+
+
+class LearnedMoveProposer(MoveProposer):
+    """Proposes cells in the order a learned policy values them, looping back around once all have been proposed."""
+
+    policy = None
+
+    def propose_move(self) -> int:
+        return self.policy.successors(self._claimable_cells)[self._cursor_index]
+
+
+def learned_move_proposer_class(policy) -> type:
+    return type("BoundLearnedMoveProposer", (LearnedMoveProposer,), {"policy": policy})
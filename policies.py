@@ -0,0 +1,80 @@
+import json
+
+
+class LinearValuePolicy(object):
+    """A linear value function over the column and row of a cell.
+
+    Each cell is described by a one-hot column feature and a one-hot row feature, so its value is simply
+    `column_weights[x] + row_weights[y]`.  The value estimates how likely a cell is to still be scoring for whoever
+    played it at the end of the game, and a player following the policy works through cells from most to least
+    valuable.
+    """
+
+    def __init__(self, game_dimensions, shade_size, weights: list = None):
+        self.game_dimensions = list(game_dimensions)
+        self.shade_size = shade_size
+        w, h = self.game_dimensions
+        self.weights = list(weights) if weights is not None else [0.0] * (w + h)
+
+        if len(self.weights) != w + h:
+            raise ValueError(f"A {w}x{h} board needs {w + h} weights, got {len(self.weights)}")
+
+        self._rankings = {}
+        self._last_claimable_cells = None
+        self._last_ranking = None
+
+    def __repr__(self):
+        return "<LinearValuePolicy({}, {})>".format(self.game_dimensions, self.shade_size)
+
+    def feature_indexes(self, cell) -> tuple:
+        """The indexes of the two active (one-hot) features for a cell."""
+        x, y = cell
+        return x, self.game_dimensions[0] + y
+
+    def value(self, cell) -> float:
+        column_feature, row_feature = self.feature_indexes(cell)
+        return self.weights[column_feature] + self.weights[row_feature]
+
+    def _cached_ranking(self, claimable_cells) -> tuple:
+        """The (ranking, successors) for `claimable_cells`, worked out once per set of cells."""
+        # Algorithms pass the same list on every move, so skip building a key when it's the last list we were given
+        if claimable_cells is not self._last_claimable_cells:
+            key = tuple(claimable_cells)
+            if key not in self._rankings:
+                ranking = sorted(range(len(key)), key=lambda i: -self.value(key[i]))
+                successors = [0] * len(ranking)
+                for position, index in enumerate(ranking):
+                    successors[index] = ranking[(position + 1) % len(ranking)]
+                self._rankings[key] = ranking, successors
+
+            self._last_claimable_cells = claimable_cells
+            self._last_ranking = self._rankings[key]
+
+        return self._last_ranking
+
+    def ranking(self, claimable_cells) -> list[int]:
+        """Indexes into `claimable_cells`, from most to least valuable.  Ties keep their original order."""
+        return self._cached_ranking(claimable_cells)[0]
+
+    def successors(self, claimable_cells) -> list[int]:
+        """For each index into `claimable_cells`, the index ranked next, wrapping back around to the most valuable."""
+        return self._cached_ranking(claimable_cells)[1]
+
+    def update(self, weight_deltas):
+        """Apply one batched update to the weights."""
+        self.weights = [weight + delta for weight, delta in zip(self.weights, weight_deltas)]
+        self._rankings = {}
+        self._last_claimable_cells = None
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(
+                {"game_dimensions": self.game_dimensions, "shade_size": self.shade_size, "weights": self.weights}, f
+            )
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            checkpoint = json.load(f)
+
+        return cls(checkpoint["game_dimensions"], checkpoint["shade_size"], checkpoint["weights"])
@@ -0,0 +1,229 @@
+import bisect
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+
+from game import FreeForAllGame
+from runtime import simulate_paired_games
+
+# Ratings follow Glicko-1, which is Elo with an explicit uncertainty (the rating deviation) attached to each player.
+# The deviation is what lets the matchmaker know which algorithms it still knows little about.
+INITIAL_RATING = 1500.0
+INITIAL_DEVIATION = 350.0
+MIN_DEVIATION = 30.0
+
+# How many rating neighbours on each side of the focus algorithm are considered as opponents
+MATCHMAKING_WINDOW = 8
+
+_Q = math.log(10) / 400
+
+
+def _g(deviation):
+    """Glicko's attenuation factor, an opponent with an uncertain rating tells us less about our own."""
+    return 1 / math.sqrt(1 + 3 * _Q**2 * deviation**2 / math.pi**2)
+
+
+@dataclass
+class Rating:
+    """The current estimate of a single algorithm's strength."""
+
+    rating: float = INITIAL_RATING
+    deviation: float = INITIAL_DEVIATION
+    games_played: int = 0
+
+
+def expected_score(rating, opponent):
+    """Probability that `rating` beats `opponent`, counting a draw as half a win."""
+    return 1 / (1 + 10 ** (-_g(opponent.deviation) * (rating.rating - opponent.rating) / 400))
+
+
+def information_gain(rating_a, rating_b):
+    """A heuristic for how much playing this pairing would tighten our estimates.
+
+    Games with an uncertain outcome (expected score near 0.5) between algorithms with wide deviations are the most
+    informative.  A game between two well-known algorithms of very different strength tells us almost nothing.
+    """
+    expected = expected_score(rating_a, rating_b)
+    return expected * (1 - expected) * (rating_a.deviation**2 + rating_b.deviation**2)
+
+
+def score_outcome(player_0_score, player_1_score):
+    """Convert the final scores of a game into the outcome for player 0 (1 win, 0.5 draw, 0 loss)."""
+    if player_0_score == player_1_score:
+        return 0.5
+
+    return 1.0 if player_0_score > player_1_score else 0.0
+
+
+class RatingTable(object):
+    """Ratings for a population of algorithms, keyed by an id chosen by the caller.
+
+    Ratings are updated incrementally after each game and can be saved to and loaded from a JSON file so that a
+    ranking can be picked back up across runs.  Ids must be strings or ints to be saved.
+    """
+
+    def __init__(self, ratings: dict = None):
+        self.ratings = ratings if ratings is not None else {}
+
+    def __getitem__(self, algorithm_id) -> Rating:
+        if algorithm_id not in self.ratings:
+            self.ratings[algorithm_id] = Rating()
+
+        return self.ratings[algorithm_id]
+
+    def __contains__(self, algorithm_id):
+        return algorithm_id in self.ratings
+
+    def __len__(self):
+        return len(self.ratings)
+
+    def _updated_rating(self, rating, results):
+        """Glicko-1's update for one rating period, `results` is a list of (opponent Rating, outcome) tuples."""
+        inverse_d_squared = 0
+        score_surprise = 0
+        for opponent, outcome in results:
+            g = _g(opponent.deviation)
+            expected = expected_score(rating, opponent)
+            inverse_d_squared += _Q**2 * g**2 * expected * (1 - expected)
+            score_surprise += g * (outcome - expected)
+
+        precision = 1 / rating.deviation**2 + inverse_d_squared
+        new_rating = rating.rating + _Q / precision * score_surprise
+        new_deviation = max(math.sqrt(1 / precision), MIN_DEVIATION)
+
+        return Rating(new_rating, new_deviation, rating.games_played + len(results))
+
+    def record_games(self, games):
+        """Update ratings for a rating period of (algorithm_id_0, algorithm_id_1, outcome) games.
+
+        Every game in the period is rated against the ratings from before the period, so the order the games are
+        listed in doesn't matter.
+        """
+        results = {}
+        for algorithm_id_0, algorithm_id_1, outcome in games:
+            results.setdefault(algorithm_id_0, []).append((self[algorithm_id_1], outcome))
+            results.setdefault(algorithm_id_1, []).append((self[algorithm_id_0], 1 - outcome))
+
+        updated_ratings = {
+            algorithm_id: self._updated_rating(self[algorithm_id], algorithm_results)
+            for algorithm_id, algorithm_results in results.items()
+        }
+        self.ratings.update(updated_ratings)
+
+    def record_game(self, algorithm_id_0, algorithm_id_1, outcome):
+        """Update both ratings given the outcome for the first algorithm (1 win, 0.5 draw, 0 loss)."""
+        self.record_games([(algorithm_id_0, algorithm_id_1, outcome)])
+
+    def leaderboard(self) -> list[tuple]:
+        """Returns (algorithm_id, Rating) tuples, strongest first."""
+        return sorted(self.ratings.items(), key=lambda item: item[1].rating, reverse=True)
+
+    def save(self, path):
+        """Write the table to `path`, replacing the previous file only once the new one is complete."""
+        for algorithm_id in self.ratings:
+            if not isinstance(algorithm_id, (str, int)):
+                raise TypeError(f"Only str and int algorithm ids can be saved, got {algorithm_id!r}")
+
+        # Stored as [id, rating] pairs rather than an object, because JSON would turn int ids into strings
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump([[algorithm_id, asdict(rating)] for algorithm_id, rating in self.ratings.items()], f)
+
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a table saved with `save`, or start an empty one if nothing has been saved yet."""
+        if not os.path.exists(path):
+            return cls()
+
+        with open(path) as f:
+            serialized_ratings = json.load(f)
+
+        return cls({algorithm_id: Rating(**rating) for algorithm_id, rating in serialized_ratings})
+
+
+class Matchmaker(object):
+    """Picks the next pairing to play so that a population can be ranked without a full round robin.
+
+    The algorithm we are least sure about is matched against whichever of its rating neighbours gives the highest
+    expected information gain.  Only a window of neighbours is searched so that picking a pairing stays cheap for
+    populations of thousands.
+    """
+
+    def __init__(self, rating_table: RatingTable, algorithm_ids, window=MATCHMAKING_WINDOW):
+        if len(algorithm_ids) < 2:
+            raise ValueError("Matchmaking needs at least two algorithms")
+
+        self.rating_table = rating_table
+        self.algorithm_ids = list(algorithm_ids)
+        self.window = window
+
+    def next_pairing(self) -> tuple:
+        ratings = {algorithm_id: self.rating_table[algorithm_id] for algorithm_id in self.algorithm_ids}
+
+        # Widest deviation first, fewest games played breaks ties so new algorithms get seen early
+        focus_id = max(self.algorithm_ids, key=lambda i: (ratings[i].deviation, -ratings[i].games_played))
+        focus_rating = ratings[focus_id]
+
+        by_rating = sorted(self.algorithm_ids, key=lambda i: ratings[i].rating)
+        position = bisect.bisect_left([ratings[i].rating for i in by_rating], focus_rating.rating)
+        neighbours = by_rating[max(0, position - self.window) : position + self.window + 1]
+
+        opponent_id = max(
+            (i for i in neighbours if i != focus_id),
+            key=lambda i: information_gain(focus_rating, ratings[i]),
+            default=None,
+        )
+        if opponent_id is None:
+            # Every neighbour in the window shares the focus id's rating slot, fall back to searching everyone
+            opponent_id = max(
+                (i for i in self.algorithm_ids if i != focus_id),
+                key=lambda i: information_gain(focus_rating, ratings[i]),
+            )
+
+        return focus_id, opponent_id
+
+
+def play_rated_pair(
+    rating_table: RatingTable, contenders: dict, algorithm_id_0, algorithm_id_1, game_class=FreeForAllGame, seed=0
+):
+    """Play a seat-swapped pair of games between two contenders and record both results.
+
+    Each contender plays from both seats, so neither gets its rating inflated by the first-mover advantage, and the
+    two games are rated together as a single rating period.
+    `contenders` maps each algorithm id to a factory that takes a seed, like the ones in `algorithms.py`.
+    """
+    paired_result = simulate_paired_games(game_class, contenders[algorithm_id_0], contenders[algorithm_id_1], seed)
+
+    # Both games are one rating period, so the second isn't rated against ratings the first has already moved
+    rating_table.record_games(
+        [
+            (algorithm_id_0, algorithm_id_1, score_outcome(*paired_result.scores)),
+            (algorithm_id_0, algorithm_id_1, score_outcome(*paired_result.swapped_scores)),
+        ]
+    )
+
+    return paired_result
+
+
+def rank_population(contenders: dict, number_of_pairs, rating_table: RatingTable = None, ratings_path=None, seed=0):
+    """Rank `contenders` by playing `number_of_pairs` actively matched, seat-swapped pairs of games.
+
+    If `ratings_path` is given, the table is loaded from it before play starts and saved back after every pair, so an
+    interrupted run loses at most one result.
+    """
+    if rating_table is None:
+        rating_table = RatingTable.load(ratings_path) if ratings_path else RatingTable()
+
+    matchmaker = Matchmaker(rating_table, contenders.keys())
+
+    for pair in range(number_of_pairs):
+        algorithm_id_0, algorithm_id_1 = matchmaker.next_pairing()
+        play_rated_pair(rating_table, contenders, algorithm_id_0, algorithm_id_1, seed=seed + pair)
+
+        if ratings_path:
+            rating_table.save(ratings_path)
+
+    return rating_table
@@ -0,0 +1,224 @@
+import json
+import mmap
+import os
+from array import array
+from collections import Counter
+
+from constants import TURNS_PER_GAME
+
+# Column name -> struct format code.  Every column is fixed width so that row n of any column lives at a known offset
+# and can be read straight out of the memory map.
+FIXED_COLUMNS = {
+    "game_number": "q",
+    "genome_id_0": "q",
+    "genome_id_1": "q",
+    "seat_order": "b",
+    "player_0_score": "i",
+    "player_1_score": "i",
+    "winner": "b",
+}
+# Score after each ply, one row holds `turns_per_game` values
+TRAJECTORY_COLUMNS = {
+    "player_0_trajectory": "i",
+    "player_1_trajectory": "i",
+}
+
+# Stored in the winner column when the game was a draw
+DRAW = -1
+
+INITIAL_CAPACITY = 1024
+METADATA_FILE = "metadata.json"
+
+
+def winner_from_scores(player_0_score, player_1_score):
+    if player_0_score == player_1_score:
+        return DRAW
+
+    return 0 if player_0_score > player_1_score else 1
+
+
+class ColumnFile(object):
+    """A single fixed-width column backed by a memory-mapped file that grows as rows are appended."""
+
+    def __init__(self, path, format_code, width=1, length=0):
+        self.path = path
+        self.format_code = format_code
+        self.width = width
+        self.row_size = array(format_code).itemsize * width
+        self.length = length
+
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.truncate(self.row_size * INITIAL_CAPACITY)
+
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    @property
+    def capacity(self):
+        return len(self._map) // self.row_size
+
+    def _grow(self):
+        new_size = self.row_size * self.capacity * 2
+        self._map.close()
+        self._file.truncate(new_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def encode(self, values) -> bytes:
+        """Check a row of values and convert it to the bytes `append_encoded` writes, without touching the file."""
+        if len(values) != self.width:
+            raise ValueError(f"{self.path} expects {self.width} values per row, got {len(values)}")
+
+        return array(self.format_code, values).tobytes()
+
+    def reserve(self):
+        """Make sure there is room for one more row, growing the file if needed."""
+        if self.length == self.capacity:
+            self._grow()
+
+    def append_encoded(self, row_bytes):
+        self.reserve()
+        start = self.length * self.row_size
+        self._map[start : start + self.row_size] = row_bytes
+        self.length += 1
+
+    def append(self, values):
+        self.append_encoded(self.encode(values))
+
+    def values(self) -> memoryview:
+        """A flat, zero-copy view over every value stored in this column.
+
+        The view must be released (use it as a context manager) before more rows are appended.
+        """
+        return memoryview(self._map)[: self.length * self.row_size].cast(self.format_code)
+
+    def row(self, index) -> list:
+        if not 0 <= index < self.length:
+            raise IndexError(f"Row {index} is out of range for {self.length} rows")
+
+        with self.values() as values:
+            return values[index * self.width : (index + 1) * self.width].tolist()
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class ResultsStore(object):
+    """Columnar, on-disk record of per-game outcomes.
+
+    Each column is its own memory-mapped file in `directory`, so millions of games can be written and queried without
+    ever holding them as Python objects.  Reopening a directory picks up where the previous run left off.
+    """
+
+    def __init__(self, directory, turns_per_game=TURNS_PER_GAME):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        metadata_path = os.path.join(directory, METADATA_FILE)
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        else:
+            metadata = {"turns_per_game": turns_per_game, "length": 0}
+
+        if metadata["turns_per_game"] != turns_per_game:
+            raise ValueError(f"{directory} holds games of {metadata['turns_per_game']} turns, not {turns_per_game}")
+
+        self.turns_per_game = turns_per_game
+        self.length = metadata["length"]
+
+        self.columns = {
+            name: ColumnFile(os.path.join(directory, f"{name}.col"), format_code, length=self.length)
+            for name, format_code in FIXED_COLUMNS.items()
+        }
+        for name, format_code in TRAJECTORY_COLUMNS.items():
+            self.columns[name] = ColumnFile(
+                os.path.join(directory, f"{name}.col"), format_code, width=turns_per_game, length=self.length
+            )
+
+    def __len__(self):
+        return self.length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(
+        self,
+        game_number,
+        genome_ids,
+        seat_order,
+        final_scores,
+        score_history,
+    ):
+        """Record a single game.
+
+        Scores are given in genome order, `seat_order` is 1 when genome_ids[0] played from seat 1.  `score_history` is
+        the (player_0_score, player_1_score) tuple after each ply, in the same genome order.
+        """
+        if len(score_history) != self.turns_per_game:
+            raise ValueError(f"Expected {self.turns_per_game} plies of score history, got {len(score_history)}")
+
+        player_0_score, player_1_score = final_scores
+        row_values = {
+            "game_number": game_number,
+            "genome_id_0": genome_ids[0],
+            "genome_id_1": genome_ids[1],
+            "seat_order": seat_order,
+            "player_0_score": player_0_score,
+            "player_1_score": player_1_score,
+            "winner": winner_from_scores(player_0_score, player_1_score),
+        }
+        row_values = {name: (value,) for name, value in row_values.items()}
+        row_values["player_0_trajectory"] = [scores[0] for scores in score_history]
+        row_values["player_1_trajectory"] = [scores[1] for scores in score_history]
+
+        # Every value is checked and encoded, and every column grown, before anything is written, so neither a bad
+        # value nor a failed grow (say a view still held open) can leave some columns a row longer than the others
+        encoded_row = {name: self.columns[name].encode(values) for name, values in row_values.items()}
+        for column in self.columns.values():
+            column.reserve()
+        for name, row_bytes in encoded_row.items():
+            self.columns[name].append_encoded(row_bytes)
+
+        self.length += 1
+
+    def score_counts(self, player) -> Counter:
+        """Histogram of final scores for genome `player` (0 or 1) of each game."""
+        with self.columns[f"player_{player}_score"].values() as scores:
+            return Counter(scores)
+
+    def win_counts(self) -> Counter:
+        """How many games genome 0 and genome 1 won, draws are counted under `None`."""
+        with self.columns["winner"].values() as winners:
+            counts = Counter(winners)
+
+        if DRAW in counts:
+            counts[None] = counts.pop(DRAW)
+
+        return counts
+
+    def trajectory(self, index) -> list[tuple]:
+        """The per-ply (player_0_score, player_1_score) history of the game at row `index`."""
+        return list(zip(self.columns["player_0_trajectory"].row(index), self.columns["player_1_trajectory"].row(index)))
+
+    def flush(self):
+        for column in self.columns.values():
+            column.flush()
+
+        # The metadata is only written once the column data is on disk so a crash can't claim rows that don't exist
+        metadata_path = os.path.join(self.directory, METADATA_FILE)
+        with open(f"{metadata_path}.tmp", "w") as f:
+            json.dump({"turns_per_game": self.turns_per_game, "length": self.length}, f)
+        os.replace(f"{metadata_path}.tmp", metadata_path)
+
+    def close(self):
+        self.flush()
+        for column in self.columns.values():
+            column.close()
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from constants import SHADE_SIZE, GAME_SIZE, TURNS_PER_GAME
 
 
@@ -15,11 +17,14 @@ class Runtime(object):
         # Overwrite any of the defaults if they were passed in
         self.__dict__.update(kwargs)
 
-        self.game = game_class(*self.game_size)
+        self.game = game_class(*self.game_size, sun_angle=self.shade_size)
 
         self.player_0 = {"algorithm": player_0_instance, "name": 0}
         self.player_1 = {"algorithm": player_1_instance, "name": 1}
 
+        # (player_0_score, player_1_score) at the end of each ply
+        self.score_history = []
+
     def make_move(self, player):
         """For a given player, recursively attempt moves until one succeeds."""
         move_to_attempt = player["algorithm"].propose_move()
@@ -41,6 +46,7 @@ class Runtime(object):
         player_1_move = self.make_move(self.player_1)
         self.game.apply_shade()
         player_0_score, player_1_score = self.game.calculate_score()
+        self.score_history.append((player_0_score, player_1_score))
 
         if self.print_moves:
             print(f"Player 0 Move: {player_0_move}\nPlayer 1 Move: {player_1_move}")
@@ -59,3 +65,61 @@ class Runtime(object):
         if self.print_final_score:
             player_0_score, player_1_score = score
             print(f"Player 0 score: {player_0_score}\nPlayer 1 score: {player_1_score}")
+
+
+@dataclass
+class PairedResult:
+    """The results of one seed played twice, once from each seat.
+
+    All scores are in (algorithm_a, algorithm_b) order regardless of which seat each algorithm was in.
+    """
+
+    seed: int
+    scores: tuple
+    swapped_scores: tuple
+    score_history: list
+    swapped_score_history: list
+
+    @property
+    def differential(self):
+        """Algorithm a's average margin over algorithm b, with the first-mover advantage cancelled out."""
+        algorithm_a_score, algorithm_b_score = self.scores
+        swapped_algorithm_a_score, swapped_algorithm_b_score = self.swapped_scores
+        return ((algorithm_a_score - algorithm_b_score) + (swapped_algorithm_a_score - swapped_algorithm_b_score)) / 2
+
+
+def role_seeds(seed) -> tuple:
+    """Distinct seeds for algorithm a and algorithm b of a pair, no two pair seeds share either of them."""
+    return 2 * seed, 2 * seed + 1
+
+
+def simulate_paired_games(game_class, algorithm_a_factory, algorithm_b_factory, seed, **kwargs):
+    """Play `seed` twice with the seats swapped between games and return a single PairedResult.
+
+    Both games use common random numbers: algorithm a and algorithm b each get their own seed derived from `seed`, and
+    keep it in both games.  Everything random about an algorithm (starting cursor, offsets, the moves it proposes) is
+    identical across the pair and only the seating differs.  The two algorithms never share a stream, so two copies
+    of the same random algorithm don't just copy each other's moves.  Any keyword arguments are passed through to
+    Runtime.
+    """
+    algorithm_a_seed, algorithm_b_seed = role_seeds(seed)
+
+    algorithm_a = algorithm_a_factory(seed=algorithm_a_seed)
+    algorithm_b = algorithm_b_factory(seed=algorithm_b_seed)
+    rt = Runtime(game_class, algorithm_a, algorithm_b, **kwargs)
+    scores = rt.simulate_game()
+    score_history = rt.score_history
+
+    algorithm_a = algorithm_a_factory(seed=algorithm_a_seed)
+    algorithm_b = algorithm_b_factory(seed=algorithm_b_seed)
+    swapped_rt = Runtime(game_class, algorithm_b, algorithm_a, **kwargs)
+    swapped_algorithm_b_score, swapped_algorithm_a_score = swapped_rt.simulate_game()
+    swapped_score_history = [(a_score, b_score) for b_score, a_score in swapped_rt.score_history]
+
+    return PairedResult(
+        seed,
+        scores,
+        (swapped_algorithm_a_score, swapped_algorithm_b_score),
+        score_history,
+        swapped_score_history,
+    )
@@ -0,0 +1,167 @@
+import os
+import random
+import time
+from dataclasses import dataclass
+
+from algorithms import DefaultGameParameters, GameParamaters
+from cell_calculators import AllCellCalculator
+from fast_game import BatchedFreeForAllGames
+from policies import LinearValuePolicy
+
+GAMES_PER_BATCH = 256
+LEARNING_RATE = 0.5
+# Standard deviation of the noise added to cell values when a game picks its move order
+EXPLORATION = 0.25
+
+
+@dataclass
+class TrainingReport:
+    """Throughput and progress for a single batch of self-play."""
+
+    batch: int
+    games: int
+    moves: int
+    seconds: float
+    scoring_rate: float
+
+    @property
+    def games_per_second(self):
+        return self.games / self.seconds
+
+    @property
+    def moves_per_second(self):
+        return self.moves / self.seconds
+
+    def __str__(self):
+        return (
+            f"Batch {self.batch}: {self.games_per_second:.0f} games/s, {self.moves_per_second:.0f} moves/s, "
+            f"{self.scoring_rate:.1%} of played cells scored"
+        )
+
+
+class SelfPlayTrainer(object):
+    """Trains a LinearValuePolicy by having it play against itself.
+
+    Every batch plays `games_per_batch` games side by side on a BatchedFreeForAllGames.  Each seat of each game works
+    through the cells in the order of the policy's values plus some exploration noise, the same way a
+    LearnedMoveProposer does.  Once the batch is over, every cell a player chose is labelled 1 if it was still scoring
+    for them at the end of the game and 0 otherwise, and the weights take a single averaged step towards those labels.
+    """
+
+    def __init__(
+        self,
+        game_params: GameParamaters = DefaultGameParameters(),
+        policy: LinearValuePolicy = None,
+        games_per_batch=GAMES_PER_BATCH,
+        learning_rate=LEARNING_RATE,
+        exploration=EXPLORATION,
+        seed=None,
+    ):
+        w, h = game_params.game_dimensions
+        self.turns_per_game = game_params.turns_per_game
+        self.policy = policy or LinearValuePolicy(game_params.game_dimensions, game_params.shade_size)
+        self.games = BatchedFreeForAllGames(games_per_batch, w, h, game_params.shade_size)
+        self.learning_rate = learning_rate
+        self.exploration = exploration
+        self.batches_trained = 0
+        self._random = random.Random(seed)
+
+        self._cells = AllCellCalculator(game_params).get_claimable_cells()
+        self._game_cell_indexes = [self.games.cell_index(cell) for cell in self._cells]
+        self._feature_indexes = [self.policy.feature_indexes(cell) for cell in self._cells]
+
+    def _move_order(self, values) -> list[int]:
+        """Indexes into the claimable cells, most valuable first after adding exploration noise."""
+        gauss = self._random.gauss
+        noisy_values = [value + gauss(0, self.exploration) for value in values]
+        return sorted(range(len(noisy_values)), key=noisy_values.__getitem__, reverse=True)
+
+    def play_batch(self) -> list[tuple]:
+        """Play a full batch of games and return the move order used by (player 0, player 1) in each game."""
+        values = [self.policy.value(cell) for cell in self._cells]
+        move_orders = [(self._move_order(values), self._move_order(values)) for _ in range(self.games.number_of_games)]
+        number_of_cells = len(self._cells)
+        game_cell_indexes = self._game_cell_indexes
+        attempt_move = self.games.attempt_move
+
+        self.games.reset()
+        for game, (player_0_order, player_1_order) in enumerate(move_orders):
+            for turn in range(self.turns_per_game):
+                attempt_move(game, game_cell_indexes[player_0_order[turn % number_of_cells]], 0)
+                attempt_move(game, game_cell_indexes[player_1_order[turn % number_of_cells]], 1)
+
+        return move_orders
+
+    def train_batch(self) -> TrainingReport:
+        start = time.perf_counter()
+        move_orders = self.play_batch()
+
+        weights = self.policy.weights
+        gradient = [0.0] * len(weights)
+        feature_counts = [0] * len(weights)
+        samples = 0
+        scoring_samples = 0
+        cells_per_game = self.games.cells_per_game
+        owner = self.games.owner
+        shaded = self.games.shaded
+        played_per_game = min(self.turns_per_game, len(self._cells))
+
+        for game, player_orders in enumerate(move_orders):
+            offset = game * cells_per_game
+            for player, move_order in enumerate(player_orders):
+                for cell in move_order[:played_per_game]:
+                    index = offset + self._game_cell_indexes[cell]
+                    target = 1.0 if owner[index] == player and not shaded[index] else 0.0
+
+                    column_feature, row_feature = self._feature_indexes[cell]
+                    error = target - (weights[column_feature] + weights[row_feature])
+                    gradient[column_feature] += error
+                    gradient[row_feature] += error
+                    feature_counts[column_feature] += 1
+                    feature_counts[row_feature] += 1
+
+                    samples += 1
+                    scoring_samples += target
+
+        self.policy.update(
+            [self.learning_rate * total / count if count else 0.0 for total, count in zip(gradient, feature_counts)]
+        )
+        self.batches_trained += 1
+
+        return TrainingReport(
+            self.batches_trained,
+            self.games.number_of_games,
+            self.games.number_of_games * self.turns_per_game * 2,
+            time.perf_counter() - start,
+            scoring_samples / samples,
+        )
+
+    def checkpoint_path(self, checkpoint_dir):
+        return os.path.join(checkpoint_dir, f"policy_{self.batches_trained:06d}.json")
+
+    def train(self, number_of_batches, checkpoint_dir=None, checkpoint_every=10, print_reports=True):
+        """Train for `number_of_batches`, saving a checkpoint every `checkpoint_every` batches and at the end.
+
+        Checkpoints can be passed straight to `learned_algorithm_factory`.
+        """
+        if checkpoint_dir:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+
+        reports = []
+        for _ in range(number_of_batches):
+            report = self.train_batch()
+            reports.append(report)
+
+            if print_reports:
+                print(report)
+
+            is_last_batch = len(reports) == number_of_batches
+            if checkpoint_dir and (self.batches_trained % checkpoint_every == 0 or is_last_batch):
+                self.policy.save(self.checkpoint_path(checkpoint_dir))
+
+        return reports
+
+
+if __name__ == "__main__":
+    trainer = SelfPlayTrainer(seed=0)
+    trainer.train(50, checkpoint_dir="checkpoints")
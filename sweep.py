@@ -0,0 +1,146 @@
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from algorithms import GameParamaters
+from game import SUN_ANGLES, FreeForAllGame
+from runtime import simulate_paired_games
+
+
+@dataclass(frozen=True)
+class GridPoint:
+    """A single combination of game parameters in a sweep."""
+
+    game_dimensions: tuple
+    shade_size: int
+    turns_per_game: int
+
+    @property
+    def game_params(self):
+        return GameParamaters(list(self.game_dimensions), self.shade_size, self.turns_per_game)
+
+
+@dataclass
+class SweepResult:
+    """One row of the combined sweep table, the outcome of a single seat-swapped pair of games."""
+
+    grid_point: GridPoint
+    algorithm_a: str
+    algorithm_b: str
+    seed: int
+    scores: tuple
+    swapped_scores: tuple
+    differential: float
+
+
+def parameter_grid(board_sizes, shade_sizes, turns_per_game_values) -> list[GridPoint]:
+    """Every combination of the given values, ordered by board size, then shade size, then turns per game.
+
+    Keeping points with the same board and shade size next to each other lets them share a worker's caches.  The shade
+    size is used as the game's sun angle, so it must be between 1 and 3.  Invalid values are rejected here
+    rather than part way through a sweep.
+    """
+    invalid_shade_sizes = [shade_size for shade_size in shade_sizes if shade_size not in SUN_ANGLES]
+    if invalid_shade_sizes:
+        raise ValueError(
+            f"Shade sizes must be between {SUN_ANGLES[0]}-{SUN_ANGLES[-1]} to be used as a sun angle, "
+            f"got {invalid_shade_sizes}"
+        )
+
+    grid = [
+        GridPoint(tuple(board_size), shade_size, turns_per_game)
+        for board_size, shade_size, turns_per_game in itertools.product(board_sizes, shade_sizes, turns_per_game_values)
+    ]
+    return sorted(grid, key=lambda point: (point.game_dimensions, point.shade_size, point.turns_per_game))
+
+
+def factory_name(factory) -> str:
+    """A readable name for an algorithm factory, including ones wrapped in `functools.partial`."""
+    if isinstance(factory, functools.partial):
+        return factory_name(factory.func)
+
+    return getattr(factory, "__name__", repr(factory))
+
+
+def run_grid_point(grid_point, matchups, pairs_per_point, seed=0, game_class=FreeForAllGame) -> list[SweepResult]:
+    """Play every matchup `pairs_per_point` times at a single grid point.
+
+    Pair n always uses seed `seed + n`, so results are reproducible and every grid point sees the same random numbers.
+    """
+    results = []
+    game_params = grid_point.game_params
+
+    for algorithm_a_factory, algorithm_b_factory in matchups:
+        for pair in range(pairs_per_point):
+            paired_result = simulate_paired_games(
+                game_class,
+                functools.partial(algorithm_a_factory, game_params=game_params),
+                functools.partial(algorithm_b_factory, game_params=game_params),
+                seed + pair,
+                **game_params.runtime_kwargs,
+            )
+            results.append(
+                SweepResult(
+                    grid_point,
+                    factory_name(algorithm_a_factory),
+                    factory_name(algorithm_b_factory),
+                    paired_result.seed,
+                    paired_result.scores,
+                    paired_result.swapped_scores,
+                    paired_result.differential,
+                )
+            )
+
+    return results
+
+
+def run_sweep(
+    matchups,
+    board_sizes,
+    shade_sizes,
+    turns_per_game_values,
+    pairs_per_point,
+    seed=0,
+    game_class=FreeForAllGame,
+    max_workers=None,
+) -> list[SweepResult]:
+    """Run `matchups` (pairs of algorithm factories) across the full parameter grid.
+
+    Each grid point runs as its own task, in parallel, and the results come back as one table in grid order.  Every
+    worker fills its own cache of claimable cells and shade tables, so tasks are handed out in chunks of the points
+    that share a board and shade size.  Shade sizes must be between 1 and 3, see `parameter_grid`.  Pass `max_workers=1` to run
+    everything in this process.
+    """
+    grid = parameter_grid(board_sizes, shade_sizes, turns_per_game_values)
+    run_point = functools.partial(
+        run_grid_point, matchups=matchups, pairs_per_point=pairs_per_point, seed=seed, game_class=game_class
+    )
+
+    if max_workers == 1:
+        point_results = map(run_point, grid)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # One chunk per board and shade size, the points that can share a worker's caches
+            chunksize = max(1, len(turns_per_game_values))
+            point_results = list(executor.map(run_point, grid, chunksize=chunksize))
+
+    return [result for results in point_results for result in results]
+
+
+def format_results_table(results) -> str:
+    """Summarise a sweep as one line per grid point and matchup, with the mean paired differential."""
+    lines = ["board | shade | turns | algorithm a vs algorithm b | pairs | mean differential"]
+
+    def row_key(result):
+        return (result.grid_point, result.algorithm_a, result.algorithm_b)
+
+    for (grid_point, algorithm_a, algorithm_b), group in itertools.groupby(results, key=row_key):
+        differentials = [result.differential for result in group]
+        board = "x".join(str(dimension) for dimension in grid_point.game_dimensions)
+        lines.append(
+            f"{board} | {grid_point.shade_size} | {grid_point.turns_per_game} | {algorithm_a} vs {algorithm_b} | "
+            f"{len(differentials)} | {sum(differentials) / len(differentials):.2f}"
+        )
+
+    return "\n".join(lines)
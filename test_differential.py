@@ -0,0 +1,111 @@
+import pytest
+
+from differential import BatchedEngine, Case, ReferenceEngine, check_engine, run_case, shrink
+from game import AbstractGame, PermissionError
+
+
+class ShortShadowEngine(ReferenceEngine):
+    """A deliberately broken engine that only ever casts shade one cell to the right."""
+
+    def __init__(self, w, h, sun_angle):
+        super().__init__(w, h, 1)
+
+
+class LegacyCell(object):
+    """A frozen copy of game.Cell from before the board was backed by a CellStore."""
+
+    def __init__(self, coordinates):
+        self.is_angled = False
+        self.is_shaded = False
+        self.coordinates = coordinates
+        self.claimable = True
+        self.claimed_by = None
+
+    def toggle_angle(self, player=None):
+        if self.claimed_by != player and not self.claimable:
+            raise PermissionError(self.coordinates, player)
+        else:
+            self.is_angled = not self.is_angled
+            self.claimed_by = player
+            return self.is_angled
+
+
+class LegacyCellObjectGame(AbstractGame):
+    """A frozen copy of the list-of-Cell-objects board, used to check the CellStore board against it.
+
+    Only the methods that changed when the board moved to a CellStore are overridden, the rest are shared.
+    """
+
+    def create_column(self, column_number):
+        column = []
+        for row_number in range(self.h):
+            column.append(LegacyCell((column_number, row_number)))
+
+        return column
+
+    def create_game_board(self):
+        game_board = []
+        for column_number in range(self.w):
+            game_board.append(self.create_column(column_number))
+        return game_board
+
+    def apply_shade(self):
+        for i, column in enumerate(self.game_board):
+            for j, row in enumerate(column):
+                cell = self.game_board[i][j]
+
+                if cell.is_angled:
+                    self._cast_shaddow((i, j))
+
+    def calculate_score(self):
+        player_0_score = 0
+        player_1_score = 0
+        for row in range(self.h):
+            for column in self.game_board:
+                cell = column[row]
+
+                if cell.claimed_by == 0 and not cell.is_shaded:
+                    player_0_score += 1
+                elif cell.claimed_by == 1 and not cell.is_shaded:
+                    player_1_score += 1
+
+        return (player_0_score, player_1_score)
+
+
+class LegacyEngine(ReferenceEngine):
+    game_class = LegacyCellObjectGame
+
+
+def test_cell_store_board_matches_legacy_cell_objects():
+    """The CellStore-backed reference game should match the old Cell-object board move for move."""
+    check_engine(ReferenceEngine, number_of_cases=300, reference_class=LegacyEngine)
+
+
+def test_batched_engine_matches_reference():
+    check_engine(BatchedEngine, number_of_cases=300)
+
+
+def test_run_case_reports_first_mismatch():
+    case = Case(4, 1, 2, (((2, 0), 1), ((0, 0), 0), ((1, 0), 1)))
+
+    mismatch = run_case(case, ShortShadowEngine)
+
+    # The first move's shadow would run off the board anyway, so only the second tells the engines apart
+    assert mismatch.move_number == 2
+    assert mismatch.expected.shade_map == (0, 1, 1, 1)
+    assert mismatch.actual.shade_map == (0, 1, 0, 1)
+
+
+def test_shrink_finds_minimal_case():
+    """A long failing case should shrink to the smallest board and move list that still shows the bug."""
+    moves = tuple(((x % 7, x % 5), x % 2) for x in range(40))
+    mismatch = run_case(Case(7, 5, 3, moves), ShortShadowEngine)
+
+    minimal_mismatch = shrink(mismatch, ShortShadowEngine)
+
+    assert minimal_mismatch.case == Case(3, 1, 2, (((0, 0), 0),))
+
+
+def test_check_engine_reports_shrunk_case():
+    with pytest.raises(AssertionError, match=r"Case\(w=3, h=1, sun_angle=2"):
+        check_engine(ShortShadowEngine)
@@ -0,0 +1,30 @@
+from fast_game import BatchedFreeForAllGames
+from game import FreeForAllGame
+
+MOVES = [((3, 4), 0), ((4, 4), 1), ((3, 4), 1), ((0, 0), 0), ((1, 0), 1), ((7, 7), 0), ((0, 0), 1)]
+
+
+def test_matches_reference_game():
+    """Should keep the same current and cumulative scores as FreeForAllGame after every move."""
+    reference_game = FreeForAllGame(8, 8)
+    batched_games = BatchedFreeForAllGames(2, 8, 8)
+
+    for coordinates, player in MOVES:
+        reference_game.attempt_move(coordinates, player)
+        batched_games.attempt_move(1, batched_games.cell_index(coordinates), player)
+
+        assert batched_games.score(1) == reference_game.calculate_score()
+        assert batched_games.cumulative_score(1) == (reference_game.player_0_score, reference_game.player_1_score)
+
+    # The other game in the batch should be untouched
+    assert batched_games.cumulative_score(0) == (0, 0)
+
+
+def test_reset():
+    batched_games = BatchedFreeForAllGames(1, 8, 8)
+    batched_games.attempt_move(0, batched_games.cell_index((3, 4)), 0)
+
+    batched_games.reset()
+
+    assert batched_games.cumulative_score(0) == (0, 0)
+    assert not any(batched_games.angled)
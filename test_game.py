@@ -1,5 +1,5 @@
 import pytest
-from game import FreeForAllGame
+from game import Cell, FreeForAllGame
 
 
 @pytest.fixture
@@ -57,3 +57,34 @@ def test_calculate_score_claimed_by_handling(mock_game):
 
     score = mock_game.calculate_score()
     assert score == (0, 1)
+
+
+def test_cell_is_a_view_onto_the_board(mock_game):
+    """Changes made through one Cell should be seen by every other Cell for the same coordinates."""
+    mock_game.game_board[2][5].claimed_by = 1
+    mock_game.game_board[2][5].is_shaded = True
+
+    cell = mock_game.game_board[2][5]
+    assert cell.claimed_by == 1
+    assert cell.is_shaded is True
+    assert cell.coordinates == (2, 5)
+
+
+def test_standalone_cell():
+    cell = Cell((0, 0))
+
+    assert cell.toggle_angle(player=0) is True
+    assert cell.claimed_by == 0
+
+
+def test_game_board_indexing():
+    """Should index like a list of columns, including raising IndexError off the edge of the board."""
+    game = FreeForAllGame(3, 2)
+
+    assert len(game.game_board) == 3
+    assert len(game.game_board[0]) == 2
+    assert game.game_board[-1][-1].coordinates == (2, 1)
+    with pytest.raises(IndexError):
+        game.game_board[3]
+    with pytest.raises(IndexError):
+        game.game_board[0][2]
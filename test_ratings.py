@@ -0,0 +1,119 @@
+import pytest
+
+from algorithms import random_algorithm_factory, systematic_max_shade_factory
+from ratings import INITIAL_RATING, Matchmaker, Rating, RatingTable, play_rated_pair, rank_population, score_outcome
+
+
+@pytest.fixture
+def rating_table():
+    return RatingTable()
+
+
+def test_score_outcome():
+    assert score_outcome(10, 4) == 1.0
+    assert score_outcome(4, 10) == 0.0
+    assert score_outcome(7, 7) == 0.5
+
+
+def test_record_game_moves_ratings_apart(rating_table):
+    """The winner should gain rating, the loser should lose it, and both should become more certain."""
+    rating_table.record_game("a", "b", 1.0)
+
+    assert rating_table["a"].rating > INITIAL_RATING
+    assert rating_table["b"].rating < INITIAL_RATING
+    assert rating_table["a"].deviation < Rating().deviation
+    assert rating_table["a"].games_played == 1
+
+
+def test_ratings_survive_save_and_load(rating_table, tmp_path):
+    ratings_path = tmp_path / "ratings.json"
+    rating_table.record_game("a", "b", 0.0)
+    rating_table.save(ratings_path)
+
+    loaded_table = RatingTable.load(ratings_path)
+
+    assert loaded_table.ratings == rating_table.ratings
+
+
+def test_int_ids_survive_save_and_load(rating_table, tmp_path):
+    """JSON object keys are always strings, int ids should still come back as ints."""
+    ratings_path = tmp_path / "ratings.json"
+    rating_table.record_game(0, 1, 1.0)
+    rating_table.save(ratings_path)
+
+    loaded_table = RatingTable.load(ratings_path)
+
+    assert loaded_table.ratings == rating_table.ratings
+    assert sorted(loaded_table.ratings) == [0, 1]
+
+
+def test_save_rejects_unserializable_ids(rating_table, tmp_path):
+    rating_table.record_game(("a", 1), "b", 1.0)
+
+    with pytest.raises(TypeError):
+        rating_table.save(tmp_path / "ratings.json")
+
+
+def test_play_rated_pair_plays_both_seats(rating_table):
+    """Identical contenders should each win from the stronger seat, leaving their ratings level."""
+    contenders = {"a": systematic_max_shade_factory, "b": systematic_max_shade_factory}
+
+    paired_result = play_rated_pair(rating_table, contenders, "a", "b", seed=3)
+
+    assert paired_result.swapped_scores == paired_result.scores[::-1]
+    assert rating_table["a"].games_played == 2
+    assert rating_table["a"].rating == pytest.approx(rating_table["b"].rating)
+
+
+def test_record_games_uses_pre_period_ratings(rating_table):
+    """A win and a loss in the same rating period should cancel out, whichever order they're listed in."""
+    rating_table.record_games([("a", "b", 1.0), ("a", "b", 0.0)])
+
+    assert rating_table["a"].rating == pytest.approx(INITIAL_RATING)
+    assert rating_table["b"].rating == pytest.approx(INITIAL_RATING)
+    assert rating_table["a"].deviation < Rating().deviation
+
+
+def test_identical_contenders_stay_level():
+    contenders = {"a": systematic_max_shade_factory, "b": systematic_max_shade_factory}
+
+    rating_table = rank_population(contenders, 5)
+
+    assert rating_table["a"].rating == pytest.approx(rating_table["b"].rating)
+    assert rating_table["a"].rating == pytest.approx(INITIAL_RATING)
+
+
+def test_matchmaker_prefers_close_uncertain_pairing(rating_table):
+    """A new algorithm should be matched against the closest, least certain opponent."""
+    rating_table.ratings = {
+        "new": Rating(),
+        "close": Rating(1510, 200, 5),
+        "far": Rating(2400, 200, 5),
+        "certain": Rating(1500, 30, 500),
+    }
+    matchmaker = Matchmaker(rating_table, rating_table.ratings.keys())
+
+    assert matchmaker.next_pairing() == ("new", "close")
+
+
+def test_rank_population(tmp_path):
+    """Should play the requested pairs of games and persist the ratings for every contender."""
+    ratings_path = tmp_path / "ratings.json"
+    contenders = {"random": random_algorithm_factory, "systematic_max_shade": systematic_max_shade_factory}
+
+    rating_table = rank_population(contenders, 4, ratings_path=ratings_path)
+
+    assert sum(rating.games_played for rating in rating_table.ratings.values()) == 16
+    assert RatingTable.load(ratings_path).ratings == rating_table.ratings
+
+
+def test_rank_population_resumes_with_int_ids(tmp_path):
+    """A second run should carry on from the saved ratings rather than starting the int ids over."""
+    ratings_path = tmp_path / "ratings.json"
+    contenders = {0: random_algorithm_factory, 1: systematic_max_shade_factory}
+
+    rank_population(contenders, 2, ratings_path=ratings_path)
+    rating_table = rank_population(contenders, 2, ratings_path=ratings_path)
+
+    assert sorted(rating_table.ratings) == [0, 1]
+    assert rating_table[0].games_played == 8
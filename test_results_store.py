@@ -0,0 +1,76 @@
+import pytest
+
+from results_store import INITIAL_CAPACITY, ResultsStore
+
+TURNS_PER_GAME = 2
+
+
+@pytest.fixture
+def results_store(tmp_path):
+    store = ResultsStore(tmp_path / "results", turns_per_game=TURNS_PER_GAME)
+    yield store
+    store.close()
+
+
+def test_append_and_query(results_store):
+    """Should count final scores and winners per seat, with draws under None."""
+    results_store.append(0, (10, 11), 0, (3, 1), [(1, 0), (3, 1)])
+    results_store.append(1, (10, 11), 1, (2, 2), [(1, 1), (2, 2)])
+    results_store.append(2, (10, 12), 0, (3, 5), [(2, 2), (3, 5)])
+
+    assert len(results_store) == 3
+    assert results_store.score_counts(0) == {3: 2, 2: 1}
+    assert results_store.score_counts(1) == {1: 1, 2: 1, 5: 1}
+    assert results_store.win_counts() == {0: 1, 1: 1, None: 1}
+    assert results_store.trajectory(2) == [(2, 2), (3, 5)]
+
+
+def test_store_grows_past_initial_capacity(results_store):
+    for game_number in range(INITIAL_CAPACITY + 1):
+        results_store.append(game_number, (0, 1), 0, (1, 0), [(1, 0), (1, 0)])
+
+    assert results_store.win_counts() == {0: INITIAL_CAPACITY + 1}
+    assert results_store.columns["game_number"].row(INITIAL_CAPACITY) == [INITIAL_CAPACITY]
+
+
+def test_store_reopens_existing_results(tmp_path):
+    """Rows written by a previous run should still be there after reopening the directory."""
+    with ResultsStore(tmp_path, turns_per_game=TURNS_PER_GAME) as results_store:
+        results_store.append(0, (0, 1), 0, (4, 1), [(2, 1), (4, 1)])
+
+    with ResultsStore(tmp_path, turns_per_game=TURNS_PER_GAME) as reopened_store:
+        assert len(reopened_store) == 1
+        assert reopened_store.trajectory(0) == [(2, 1), (4, 1)]
+
+
+def test_append_rejects_wrong_trajectory_length(results_store):
+    with pytest.raises(ValueError):
+        results_store.append(0, (0, 1), 0, (1, 0), [(1, 0)])
+
+
+def test_failed_append_leaves_columns_in_step(results_store):
+    """A value that can't be stored should not leave any column with an extra row."""
+    results_store.append(0, (0, 1), 0, (1, 0), [(1, 0), (1, 0)])
+
+    with pytest.raises(TypeError):
+        results_store.append(1, ("a", "b"), 0, (1, 0), [(1, 0), (1, 0)])
+    with pytest.raises(OverflowError):
+        results_store.append(2, (0, 1), 0, (1, 0), [(1, 0), (2**40, 0)])
+
+    assert len(results_store) == 1
+    assert {column.length for column in results_store.columns.values()} == {1}
+
+
+def test_failed_grow_leaves_columns_in_step(results_store):
+    """A column that can't grow because a view is still open should not leave earlier columns a row ahead."""
+    for game_number in range(INITIAL_CAPACITY):
+        results_store.append(game_number, (0, 1), 0, (1, 0), [(1, 0), (1, 0)])
+
+    with results_store.columns["winner"].values():
+        with pytest.raises(BufferError):
+            results_store.append(INITIAL_CAPACITY, (0, 1), 0, (1, 0), [(1, 0), (1, 0)])
+
+    assert {column.length for column in results_store.columns.values()} == {INITIAL_CAPACITY}
+
+    results_store.append(INITIAL_CAPACITY, (0, 1), 0, (1, 0), [(1, 0), (1, 0)])
+    assert results_store.columns["winner"].row(INITIAL_CAPACITY) == [0]
@@ -0,0 +1,80 @@
+from algorithms import (
+    random_algorithm_factory,
+    random_start_random_offset_max_shade_factory,
+    systematic_max_shade_factory,
+)
+from game import FreeForAllGame
+from runtime import PairedResult, simulate_paired_games
+
+
+def test_paired_result_differential():
+    """Should average algorithm a's margin over both seatings."""
+    paired_result = PairedResult(0, (10, 4), (3, 5), [], [])
+
+    assert paired_result.differential == 2
+
+
+def test_simulate_paired_games_is_deterministic():
+    """The same seed should produce the same pair of games."""
+    paired_result_1 = simulate_paired_games(FreeForAllGame, random_algorithm_factory, systematic_max_shade_factory, 7)
+    paired_result_2 = simulate_paired_games(FreeForAllGame, random_algorithm_factory, systematic_max_shade_factory, 7)
+
+    assert paired_result_1 == paired_result_2
+
+
+def test_simulate_paired_games_swaps_seats():
+    """Identical algorithms should mirror each other exactly when the seats are swapped."""
+    paired_result = simulate_paired_games(FreeForAllGame, systematic_max_shade_factory, systematic_max_shade_factory, 3)
+
+    assert paired_result.swapped_scores == paired_result.scores[::-1]
+    assert paired_result.differential == 0
+    assert paired_result.swapped_score_history[-1] == paired_result.swapped_scores
+
+
+def recording_factory(algorithm_factory, move_logs):
+    """Wraps an algorithm factory so that every move each built algorithm proposes is logged."""
+
+    def factory(seed=None):
+        algorithm = algorithm_factory(seed=seed)
+        moves = []
+        move_logs.append(moves)
+        propose_move = algorithm.propose_move
+
+        def recorded_propose_move():
+            moves.append(propose_move())
+            return moves[-1]
+
+        algorithm.propose_move = recorded_propose_move
+        return algorithm
+
+    return factory
+
+
+def test_simulate_paired_games_shares_random_numbers_across_seats():
+    """An algorithm that moves randomly should play exactly the same moves from both seats."""
+    random_moves = []
+    random_offset_moves = []
+
+    simulate_paired_games(
+        FreeForAllGame,
+        recording_factory(random_algorithm_factory, random_moves),
+        recording_factory(random_start_random_offset_max_shade_factory, random_offset_moves),
+        5,
+    )
+
+    first_seating_moves, swapped_seating_moves = random_moves
+    assert first_seating_moves == swapped_seating_moves
+    assert len(set(first_seating_moves)) > 1
+    assert random_offset_moves[0] == random_offset_moves[1]
+
+
+def test_mirror_matchup_of_random_algorithm_is_not_a_copycat_game():
+    """Two copies of a random algorithm should make their own moves, rather than one copying and stealing the other's."""
+    paired_results = [
+        simulate_paired_games(FreeForAllGame, random_algorithm_factory, random_algorithm_factory, seed)
+        for seed in range(6)
+    ]
+
+    for paired_result in paired_results:
+        assert min(paired_result.scores + paired_result.swapped_scores) > 0
+    assert len({paired_result.scores for paired_result in paired_results}) > 1
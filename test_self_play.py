@@ -0,0 +1,52 @@
+import pytest
+
+from algorithms import GameParamaters, learned_algorithm_factory
+from policies import LinearValuePolicy
+from self_play import SelfPlayTrainer
+
+
+def test_learned_algorithm_follows_policy_ranking():
+    """Should start at the most valuable cell and work down from there."""
+    policy = LinearValuePolicy([3, 2], 1, [0.0, 2.0, 1.0, 0.5, 0.0])
+    algorithm = learned_algorithm_factory(policy, seed=42)
+
+    moves = [algorithm.propose_move() for _ in range(7)]
+
+    assert moves == [(1, 0), (1, 1), (2, 0), (2, 1), (0, 0), (0, 1), (1, 0)]
+
+
+def test_learned_algorithm_checks_game_params():
+    policy = LinearValuePolicy([3, 2], 1)
+
+    algorithm = learned_algorithm_factory(policy, game_params=GameParamaters([3, 2], 1, 4))
+    assert algorithm._game_params.turns_per_game == 4
+
+    with pytest.raises(ValueError, match="shade size 1"):
+        learned_algorithm_factory(policy, game_params=GameParamaters([3, 2], 2))
+    with pytest.raises(ValueError):
+        learned_algorithm_factory(policy, game_params=GameParamaters([4, 4], 1))
+
+
+def test_train_saves_loadable_checkpoints(tmp_path):
+    game_params = GameParamaters([4, 4], 1, 6)
+    trainer = SelfPlayTrainer(game_params, games_per_batch=8, seed=0)
+
+    reports = trainer.train(3, checkpoint_dir=tmp_path, checkpoint_every=2, print_reports=False)
+
+    assert [report.batch for report in reports] == [1, 2, 3]
+    assert reports[0].moves == 8 * 6 * 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["policy_000002.json", "policy_000003.json"]
+
+    checkpoint_path = trainer.checkpoint_path(tmp_path)
+    assert LinearValuePolicy.load(checkpoint_path).weights == trainer.policy.weights
+    assert learned_algorithm_factory(checkpoint_path).game_dimensions == [4, 4]
+
+
+def test_training_is_deterministic():
+    game_params = GameParamaters([4, 4], 2, 6)
+
+    trainers = [SelfPlayTrainer(game_params, games_per_batch=8, seed=3) for _ in range(2)]
+    for trainer in trainers:
+        trainer.train(2, print_reports=False)
+
+    assert trainers[0].policy.weights == trainers[1].policy.weights
@@ -0,0 +1,62 @@
+import functools
+
+import pytest
+
+from algorithms import learned_algorithm_factory, random_algorithm_factory, systematic_max_shade_factory
+from policies import LinearValuePolicy
+from sweep import GridPoint, factory_name, format_results_table, parameter_grid, run_sweep
+
+MATCHUPS = [(random_algorithm_factory, systematic_max_shade_factory)]
+
+
+def test_parameter_grid():
+    grid = parameter_grid([(4, 4), (6, 5)], [1, 2], [8])
+
+    assert len(grid) == 4
+    assert grid[-1] == GridPoint((6, 5), 2, 8)
+
+
+def test_parameter_grid_groups_points_by_board_and_shade_size():
+    grid = parameter_grid([(6, 5), (4, 4)], [2, 1], [8, 4])
+
+    assert [(point.game_dimensions, point.shade_size) for point in grid[:2]] == [((4, 4), 1), ((4, 4), 1)]
+    assert grid == sorted(grid, key=lambda point: (point.game_dimensions, point.shade_size, point.turns_per_game))
+
+
+def test_factory_name_unwraps_partials():
+    assert factory_name(functools.partial(random_algorithm_factory, seed=1)) == "random_algorithm_factory"
+
+
+def test_run_sweep_covers_grid():
+    """Should return one row per pair, per matchup, per grid point, with scores that respect the board size."""
+    results = run_sweep(MATCHUPS, [(4, 4), (6, 5)], [1, 2], [4, 8], pairs_per_point=2, max_workers=1)
+
+    assert len(results) == 16
+    for result in results:
+        width, height = result.grid_point.game_dimensions
+        assert max(result.scores + result.swapped_scores) <= width * height
+
+    assert format_results_table(results).count("\n") == 8
+
+
+def test_run_sweep_is_deterministic_in_parallel():
+    """Running in worker processes should give exactly the same table as running serially."""
+    sweep_args = (MATCHUPS, [(4, 4), (5, 5)], [2, 3], [6], 2)
+
+    assert run_sweep(*sweep_args, max_workers=2) == run_sweep(*sweep_args, max_workers=1)
+
+
+def test_parameter_grid_rejects_invalid_shade_sizes():
+    """Shade sizes outside the sun angle range should fail before any games are played."""
+    with pytest.raises(ValueError, match=r"got \[0, 4\]"):
+        parameter_grid([(4, 4)], [0, 2, 4], [8])
+
+
+def test_run_sweep_with_learned_algorithm():
+    """A learned algorithm bound with functools.partial should play at a grid point matching its policy."""
+    learned_factory = functools.partial(learned_algorithm_factory, LinearValuePolicy([4, 4], 2))
+
+    results = run_sweep([(learned_factory, random_algorithm_factory)], [(4, 4)], [2], [6], 2, max_workers=1)
+
+    assert len(results) == 2
+    assert results[0].algorithm_a == "learned_algorithm_factory"